@@ -134,7 +134,7 @@ def version_from_modernized_installer(installer: MojangVersion, version: ForgeVe
 
     mc_filter = load_mc_version_filter(mc_version)
     for upstream_lib in installer.libraries:
-        forge_lib = Library.parse_obj(upstream_lib.dict())  # "cast" MojangLibrary to Library
+        forge_lib = Library.model_construct(**dict(upstream_lib))  # "cast" MojangLibrary to Library, it is already validated
         if forge_lib.name.is_lwjgl() or forge_lib.name.is_log4j() or should_ignore_artifact(mc_filter, forge_lib.name):
             continue
 
@@ -204,7 +204,7 @@ def version_from_build_system_installer(installer: MojangVersion, profile: Forge
     v.maven_files.append(installer_lib)
 
     for upstream_lib in profile.libraries:
-        forge_lib = Library.parse_obj(upstream_lib.dict())
+        forge_lib = Library.model_construct(**dict(upstream_lib))
         if forge_lib.name.is_log4j():
             continue
 
@@ -223,7 +223,7 @@ def version_from_build_system_installer(installer: MojangVersion, profile: Forge
     v.libraries.append(wrapper_lib)
 
     for upstream_lib in installer.libraries:
-        forge_lib = Library.parse_obj(upstream_lib.dict())
+        forge_lib = Library.model_construct(**dict(upstream_lib))
         if forge_lib.name.is_log4j():
             continue
 
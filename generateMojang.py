@@ -1,4 +1,3 @@
-import copy
 import hashlib
 import os
 from collections import defaultdict, namedtuple
@@ -92,7 +91,7 @@ BAD_VARIANTS = [
 def add_or_get_bucket(buckets, rules: Optional[MojangRules]) -> MetaVersion:
     rule_hash = None
     if rules:
-        rule_hash = hash(rules.json())
+        rule_hash = hash(tuple(rule.json() for rule in rules))
 
     if rule_hash in buckets:
         bucket = buckets[rule_hash]
@@ -104,9 +103,8 @@ def add_or_get_bucket(buckets, rules: Optional[MojangRules]) -> MetaVersion:
 
 
 def hash_lwjgl_version(lwjgl: MetaVersion):
-    lwjgl_copy = copy.deepcopy(lwjgl)
-    lwjgl_copy.release_time = None
-    return hashlib.sha1(lwjgl_copy.json().encode("utf-8", "strict")).hexdigest()
+    # the release time is not part of the variant
+    return hashlib.sha1(lwjgl.json(exclude={"release_time"}).encode("utf-8", "strict")).hexdigest()
 
 
 def sort_libs_by_name(library):
@@ -119,7 +117,7 @@ lwjglVersionVariants = defaultdict(list)
 
 
 def add_lwjgl_version(variants, lwjgl):
-    lwjgl_copy = copy.deepcopy(lwjgl)
+    lwjgl_copy = lwjgl.model_copy()
     libraries = list(lwjgl_copy.libraries)
     libraries.sort(key=sort_libs_by_name)
     lwjgl_copy.libraries = libraries
@@ -183,7 +181,7 @@ def is_macos_only(rules: Optional[MojangRules]):
 
 def process_single_variant(lwjgl_variant: MetaVersion):
     lwjgl_version = lwjgl_variant.version
-    v = copy.deepcopy(lwjgl_variant)
+    v = lwjgl_variant.model_copy()
 
     if lwjgl_version[0] == '2':
         static_filename = os.path.join(STATIC_DIR, LWJGL_COMPONENT, f"{lwjgl_version}.json")
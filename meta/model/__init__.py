@@ -1,13 +1,33 @@
+import json
+import re
+import sys
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Iterator
+from typing import Optional, List, Dict, Any
 
 import pydantic
-from pydantic import Field, validator
+from pydantic import ConfigDict, Field, field_validator
+from pydantic_core import core_schema
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..common import serialize_datetime, replace_old_launchermeta_url
 
 META_FORMAT_VERSION = 1
 
+# fields that make up the string form of a GradleSpecifier
+_SPECIFIER_FIELDS = frozenset({"group", "artifact", "version", "classifier", "extension"})
+
+# these repeat across thousands of libraries, so they get interned
+_INTERNED_FIELDS = frozenset({"group", "artifact", "extension"})
+
+_LWJGL_GROUPS = frozenset({"org.lwjgl", "org.lwjgl.lwjgl", "net.java.jinput", "net.java.jutils"})
+
+_VALID_OS = frozenset({"osx", "linux", "windows"})
+_VALID_ACTION = frozenset({"allow", "disallow"})
+
 
 class GradleSpecifier:
     """
@@ -17,6 +37,8 @@ class GradleSpecifier:
         "net.minecraft:launchwrapper:1.5"
     """
 
+    __slots__ = ("group", "artifact", "version", "classifier", "extension", "_str", "_path", "_group_path")
+
     def __init__(self, group: str, artifact: str, version: str, classifier: Optional[str] = None,
                  extension: Optional[str] = None):
         if extension is None:
@@ -27,32 +49,50 @@ class GradleSpecifier:
         self.classifier = classifier
         self.extension = extension
 
-    def __str__(self):
-        ext = ''
+    def __setattr__(self, key, value):
+        if key in _INTERNED_FIELDS:
+            value = sys.intern(value)
+        object.__setattr__(self, key, value)
+        # specifiers get patched in place by the generators, drop the cached string and path when that happens
+        if key in _SPECIFIER_FIELDS:
+            object.__setattr__(self, "_str", None)
+            object.__setattr__(self, "_path", None)
+            if key == "group":
+                object.__setattr__(self, "_group_path", sys.intern(value.replace('.', '/')))
+
+    def _format(self):
         if self.extension != 'jar':
-            ext = "@%s" % self.extension
+            if self.classifier:
+                return f"{self.group}:{self.artifact}:{self.version}:{self.classifier}@{self.extension}"
+            return f"{self.group}:{self.artifact}:{self.version}@{self.extension}"
         if self.classifier:
-            return "%s:%s:%s:%s%s" % (self.group, self.artifact, self.version, self.classifier, ext)
-        else:
-            return "%s:%s:%s%s" % (self.group, self.artifact, self.version, ext)
+            return f"{self.group}:{self.artifact}:{self.version}:{self.classifier}"
+        return f"{self.group}:{self.artifact}:{self.version}"
+
+    def __str__(self):
+        if self._str is None:
+            self._str = sys.intern(self._format())
+        return self._str
 
     def filename(self):
         if self.classifier:
-            return "%s-%s-%s.%s" % (self.artifact, self.version, self.classifier, self.extension)
+            return f"{self.artifact}-{self.version}-{self.classifier}.{self.extension}"
         else:
-            return "%s-%s.%s" % (self.artifact, self.version, self.extension)
+            return f"{self.artifact}-{self.version}.{self.extension}"
 
     def base(self):
-        return "%s/%s/%s/" % (self.group.replace('.', '/'), self.artifact, self.version)
+        return f"{self._group_path}/{self.artifact}/{self.version}/"
 
     def path(self):
-        return self.base() + self.filename()
+        if self._path is None:
+            self._path = self.base() + self.filename()
+        return self._path
 
     def __repr__(self):
         return f"GradleSpecifier('{self}')"
 
     def is_lwjgl(self):
-        return self.group in ("org.lwjgl", "org.lwjgl.lwjgl", "net.java.jinput", "net.java.jutils")
+        return self.group in _LWJGL_GROUPS
 
     def is_log4j(self):
         return self.group == "org.apache.logging.log4j"
@@ -70,26 +110,23 @@ class GradleSpecifier:
         return hash(str(self))
 
     @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
+    def __get_pydantic_core_schema__(cls, source_type, handler):
+        return core_schema.no_info_plain_validator_function(cls.validate,
+                                                            serialization=core_schema.to_string_ser_schema())
 
     @classmethod
     def from_string(cls, v: str):
-        ext_split = v.split('@')
+        coordinates, _, extension = v.partition('@')
 
-        components = ext_split[0].split(':')
+        components = coordinates.split(':', 3)
         group = components[0]
         artifact = components[1]
         version = components[2]
 
-        extension = None
-        if len(ext_split) == 2:
-            extension = ext_split[1]
-
         classifier = None
         if len(components) == 4:
             classifier = components[3]
-        return cls(group, artifact, version, classifier, extension)
+        return cls(group, artifact, version, classifier, extension or None)
 
     @classmethod
     def validate(cls, v):
@@ -97,54 +134,90 @@ class GradleSpecifier:
             return v
         if isinstance(v, str):
             return cls.from_string(v)
-        raise TypeError("Invalid type")
+        raise ValueError("Invalid type")
+
+
+# json.dumps escapes everything outside of printable ASCII by default, orjson writes it as UTF-8
+_JSON_NON_ASCII = re.compile("[\x7f-\U0010ffff]")
+
+
+def _json_default(obj):
+    if isinstance(obj, datetime):
+        return serialize_datetime(obj)
+    if isinstance(obj, GradleSpecifier):
+        return str(obj)
+    raise TypeError
+
+
+def _json_escape(match):
+    n = ord(match.group(0))
+    if n < 0x10000:
+        return f"\\u{n:04x}"
+    n -= 0x10000
+    return f"\\u{0xd800 | (n >> 10):04x}\\u{0xdc00 | (n & 0x3ff):04x}"
+
+
+def _dump_json(obj) -> bytes:
+    """
+        Serialize plain data to JSON using orjson.
+        The result is byte-for-byte what json.dumps(obj, sort_keys=True, indent=4) would produce.
+        This matters, as generateMojang hashes this output to identify LWJGL variants.
+    """
+    data = orjson.dumps(obj, default=_json_default,
+                        option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME)
+    # orjson can only indent by two spaces, double the indentation of every line
+    lines = [b" " * (len(line) - len(line.lstrip(b" "))) + line for line in data.split(b"\n")]
+    data = b"\n".join(lines)
+    if not data.isascii() or b"\x7f" in data:
+        data = _JSON_NON_ASCII.sub(_json_escape, data.decode("utf-8")).encode("ascii")
+    return data
 
 
 class MetaBase(pydantic.BaseModel):
-    def dict(self, **kwargs) -> Dict[str, Any]:
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True, coerce_numbers_to_str=True)
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
         for k in ["by_alias"]:
             if k in kwargs:
                 del kwargs[k]
 
-        return super(MetaBase, self).dict(by_alias=True, **kwargs)
+        return super(MetaBase, self).model_dump(by_alias=True, **kwargs)
 
     def json(self, **kwargs: Any) -> str:
         for k in ["exclude_none", "sort_keys", "indent"]:
             if k in kwargs:
                 del kwargs[k]
 
-        return super(MetaBase, self).json(exclude_none=True, sort_keys=True, by_alias=True, indent=4, **kwargs)
+        return self._json_bytes(**kwargs).decode("ascii")
 
-    def write(self, file_path):
-        with open(file_path, "w") as f:
-            f.write(self.json())
+    def _json_bytes(self, **kwargs) -> bytes:
+        data = self.model_dump(exclude_none=True, **kwargs)
+        if orjson is None:
+            return json.dumps(data, default=_json_default, sort_keys=True, indent=4).encode("ascii")
+        return _dump_json(data)
 
-    class Config:
-        allow_population_by_field_name = True
+    def write(self, file_path):
+        with open(file_path, "wb") as f:
+            f.write(self._json_bytes())
 
-        json_encoders = {
-            datetime: serialize_datetime,
-            GradleSpecifier: str
-        }
+    @classmethod
+    def parse_file(cls, file_path):
+        with open(file_path, "rb") as f:
+            return cls.model_validate_json(f.read())
 
 
 class Versioned(MetaBase):
-    @validator("format_version")
-    def format_version_must_be_supported(cls, v):
-        assert v <= META_FORMAT_VERSION
-        return v
-
-    format_version: int = Field(META_FORMAT_VERSION, alias="formatVersion")
+    format_version: int = Field(META_FORMAT_VERSION, alias="formatVersion", le=META_FORMAT_VERSION)
 
 
 class MojangArtifactBase(MetaBase):
-    sha1: Optional[str]
-    size: Optional[int]
+    sha1: Optional[str] = None
+    size: Optional[int] = None
     url: str
 
 
 class MojangAssets(MojangArtifactBase):
-    @validator("url")
+    @field_validator("url")
     def validate_url(cls, v):
         return replace_old_launchermeta_url(v)
 
@@ -153,7 +226,7 @@ class MojangAssets(MojangArtifactBase):
 
 
 class MojangArtifact(MojangArtifactBase):
-    path: Optional[str]
+    path: Optional[str] = None
 
 
 class MojangLibraryExtractRules(MetaBase):
@@ -174,86 +247,79 @@ class MojangLibraryExtractRules(MetaBase):
 
 
 class MojangLibraryDownloads(MetaBase):
-    artifact: Optional[MojangArtifact]
-    classifiers: Optional[Dict[Any, MojangArtifact]]
+    artifact: Optional[MojangArtifact] = None
+    classifiers: Optional[Dict[Any, MojangArtifact]] = None
 
 
 class OSRule(MetaBase):
-    @validator("name")
+    @field_validator("name")
     def name_must_be_os(cls, v):
-        assert v in ["osx", "linux", "windows"]
+        assert v in _VALID_OS
         return v
 
     name: str
-    version: Optional[str]
+    version: Optional[str] = None
 
 
 class MojangRule(MetaBase):
-    @validator("action")
+    @field_validator("action")
     def action_must_be_allow_disallow(cls, v):
-        assert v in ["allow", "disallow"]
+        assert v in _VALID_ACTION
         return v
 
     action: str
-    os: Optional[OSRule]
-
-
-class MojangRules(MetaBase):
-    __root__: List[MojangRule]
+    os: Optional[OSRule] = None
 
-    def __iter__(self) -> Iterator[MojangRule]:
-        return iter(self.__root__)
 
-    def __getitem__(self, item) -> MojangRule:
-        return self.__root__[item]
+MojangRules = List[MojangRule]
 
 
 class MojangLibrary(MetaBase):
-    extract: Optional[MojangLibraryExtractRules]
+    extract: Optional[MojangLibraryExtractRules] = None
     name: GradleSpecifier
-    downloads: Optional[MojangLibraryDownloads]
-    natives: Optional[Dict[str, str]]
-    rules: Optional[MojangRules]
+    downloads: Optional[MojangLibraryDownloads] = None
+    natives: Optional[Dict[str, str]] = None
+    rules: Optional[List[MojangRule]] = None
 
 
 class Library(MojangLibrary):
-    url: Optional[str]
+    url: Optional[str] = None
     mmcHint: Optional[str] = Field(None, alias="MMC-hint")
 
 
 class Dependency(MetaBase):
     uid: str
-    equals: Optional[str]
-    suggests: Optional[str]
+    equals: Optional[str] = None
+    suggests: Optional[str] = None
 
 
 class MetaVersion(Versioned):
     name: str
     version: str
     uid: str
-    type: Optional[str]
-    order: Optional[int]
-    volatile: Optional[bool]
-    requires: Optional[List[Dependency]]
-    conflicts: Optional[List[Dependency]]
-    libraries: Optional[List[Library]]
-    asset_index: Optional[MojangAssets] = Field(alias="assetIndex")
-    maven_files: Optional[List[Library]] = Field(alias="mavenFiles")
-    main_jar: Optional[Library] = Field(alias="mainJar")
-    jar_mods: Optional[List[Library]] = Field(alias="jarMods")
-    main_class: Optional[str] = Field(alias="mainClass")
-    applet_class: Optional[str] = Field(alias="appletClass")
-    minecraft_arguments: Optional[str] = Field(alias="minecraftArguments")
-    release_time: Optional[datetime] = Field(alias="releaseTime")
-    compatible_java_majors: Optional[List[int]] = Field(alias="compatibleJavaMajors")
-    additional_traits: Optional[List[str]] = Field(alias="+traits")
-    additional_tweakers: Optional[List[str]] = Field(alias="+tweakers")
+    type: Optional[str] = None
+    order: Optional[int] = None
+    volatile: Optional[bool] = None
+    requires: Optional[List[Dependency]] = None
+    conflicts: Optional[List[Dependency]] = None
+    libraries: Optional[List[Library]] = None
+    asset_index: Optional[MojangAssets] = Field(None, alias="assetIndex")
+    maven_files: Optional[List[Library]] = Field(None, alias="mavenFiles")
+    main_jar: Optional[Library] = Field(None, alias="mainJar")
+    jar_mods: Optional[List[Library]] = Field(None, alias="jarMods")
+    main_class: Optional[str] = Field(None, alias="mainClass")
+    applet_class: Optional[str] = Field(None, alias="appletClass")
+    minecraft_arguments: Optional[str] = Field(None, alias="minecraftArguments")
+    release_time: Optional[datetime] = Field(None, alias="releaseTime")
+    compatible_java_majors: Optional[List[int]] = Field(None, alias="compatibleJavaMajors")
+    additional_traits: Optional[List[str]] = Field(None, alias="+traits")
+    additional_tweakers: Optional[List[str]] = Field(None, alias="+tweakers")
 
 
 class MetaPackage(Versioned):
     name: str
     uid: str
-    recommended: Optional[List[str]]
-    authors: Optional[List[str]]
-    description: Optional[str]
-    project_url: Optional[str] = Field(alias="projectUrl")
+    recommended: Optional[List[str]] = None
+    authors: Optional[List[str]] = None
+    description: Optional[str] = None
+    project_url: Optional[str] = Field(None, alias="projectUrl")
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from pydantic import validator, Field
+from pydantic import field_validator, Field
 
 from . import MetaBase, MojangArtifactBase, MojangAssets, MojangLibrary, MojangArtifact, MojangLibraryDownloads, \
     Library, MetaVersion, GradleSpecifier
@@ -43,13 +43,13 @@ class MojangLatestVersion(MetaBase):
 
 
 class MojangIndexEntry(MetaBase):
-    id: Optional[str]
-    release_time: Optional[datetime] = Field(alias="releaseTime")
-    time: Optional[datetime]
-    type: Optional[str]
-    url: Optional[str]
-    sha1: Optional[str]
-    compliance_level: Optional[int] = Field(alias="complianceLevel")
+    id: Optional[str] = None
+    release_time: Optional[datetime] = Field(None, alias="releaseTime")
+    time: Optional[datetime] = None
+    type: Optional[str] = None
+    url: Optional[str] = None
+    sha1: Optional[str] = None
+    compliance_level: Optional[int] = Field(None, alias="complianceLevel")
 
 
 class MojangIndex(MetaBase):
@@ -67,7 +67,7 @@ class MojangIndexWrap:
 class ExperimentEntry(MetaBase):
     id: str
     url: str
-    wiki: Optional[str]
+    wiki: Optional[str] = None
 
 
 class ExperimentIndex(MetaBase):
@@ -81,10 +81,10 @@ class ExperimentIndexWrap:
 
 
 class LegacyOverrideEntry(MetaBase):
-    main_class: Optional[str] = Field(alias="mainClass")
-    applet_class: Optional[str] = Field(alias="appletClass")
-    release_time: Optional[datetime] = Field(alias="releaseTime")
-    additional_traits: Optional[List[str]] = Field(alias="+traits")
+    main_class: Optional[str] = Field(None, alias="mainClass")
+    applet_class: Optional[str] = Field(None, alias="appletClass")
+    release_time: Optional[datetime] = Field(None, alias="releaseTime")
+    additional_traits: Optional[List[str]] = Field(None, alias="+traits")
 
     def apply_onto_meta_version(self, meta_version: MetaVersion, legacy: bool = True):
         # simply hard override classes
@@ -112,8 +112,8 @@ class LegacyOverrideIndex(MetaBase):
 
 
 class MojangArguments(MetaBase):
-    game: Optional[List[Any]]  # mixture of strings and objects
-    jvm: Optional[List[Any]]
+    game: Optional[List[Any]] = None  # mixture of strings and objects
+    jvm: Optional[List[Any]] = None
 
 
 class MojangLoggingArtifact(MojangArtifactBase):
@@ -121,7 +121,7 @@ class MojangLoggingArtifact(MojangArtifactBase):
 
 
 class MojangLogging(MetaBase):
-    @validator("type")
+    @field_validator("type")
     def validate_type(cls, v):
         assert v in ["log4j2-xml"]
         return v
@@ -137,35 +137,25 @@ class JavaVersion(MetaBase):
 
 
 class MojangVersion(MetaBase):
-    @validator("minimum_launcher_version")
-    def validate_minimum_launcher_version(cls, v):
-        assert v <= SUPPORTED_LAUNCHER_VERSION
-        return v
-
-    @validator("compliance_level")
-    def validate_compliance_level(cls, v):
-        assert v <= SUPPORTED_COMPLIANCE_LEVEL
-        return v
-
     id: str  # TODO: optional?
-    arguments: Optional[MojangArguments]
-    asset_index: Optional[MojangAssets] = Field(alias="assetIndex")
-    assets: Optional[str]
-    downloads: Optional[Dict[str, MojangArtifactBase]]  # TODO improve this?
-    libraries: Optional[List[MojangLibrary]]  # TODO: optional?
-    main_class: Optional[str] = Field(alias="mainClass")
-    applet_class: Optional[str] = Field(alias="appletClass")
-    processArguments: Optional[str]
-    minecraft_arguments: Optional[str] = Field(alias="minecraftArguments")
+    arguments: Optional[MojangArguments] = None
+    asset_index: Optional[MojangAssets] = Field(None, alias="assetIndex")
+    assets: Optional[str] = None
+    downloads: Optional[Dict[str, MojangArtifactBase]] = None  # TODO improve this?
+    libraries: Optional[List[MojangLibrary]] = None  # TODO: optional?
+    main_class: Optional[str] = Field(None, alias="mainClass")
+    applet_class: Optional[str] = Field(None, alias="appletClass")
+    processArguments: Optional[str] = None
+    minecraft_arguments: Optional[str] = Field(None, alias="minecraftArguments")
     minimum_launcher_version: Optional[int] = Field(
-        alias="minimumLauncherVersion")
-    release_time: Optional[datetime] = Field(alias="releaseTime")
-    time: Optional[datetime]
-    type: Optional[str]
+        None, alias="minimumLauncherVersion", le=SUPPORTED_LAUNCHER_VERSION)
+    release_time: Optional[datetime] = Field(None, alias="releaseTime")
+    time: Optional[datetime] = None
+    type: Optional[str] = None
     inherits_from: Optional[str] = Field("inheritsFrom")
-    logging: Optional[Dict[str, MojangLogging]]  # TODO improve this?
-    compliance_level: Optional[int] = Field(alias="complianceLevel")
-    javaVersion: Optional[JavaVersion]
+    logging: Optional[Dict[str, MojangLogging]] = None  # TODO improve this?
+    compliance_level: Optional[int] = Field(None, alias="complianceLevel", le=SUPPORTED_COMPLIANCE_LEVEL)
+    javaVersion: Optional[JavaVersion] = None
 
     def to_meta_version(self, name: str, uid: str, version: str) -> MetaVersion:
         main_jar = None
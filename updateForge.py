@@ -1,7 +1,6 @@
 """
  Get the source files necessary for generating Forge versions
 """
-import copy
 import hashlib
 import json
 import os
@@ -78,7 +77,7 @@ def get_single_forge_files_manifest(longversion):
         index = 0
         count = 0
         while index < len(extensionObj.items()):
-            mutable_copy = copy.deepcopy(extensionObj)
+            mutable_copy = dict(extensionObj)
             extension, hashtype = mutable_copy.popitem()
             if not type(classifier) == str:
                 pprint(classifier)
@@ -277,7 +276,7 @@ def main():
                             version_data = profile_zip_entry.read()
 
                             # Process: does it parse?
-                            MojangVersion.parse_raw(version_data)
+                            MojangVersion.model_validate_json(version_data)
 
                             with open(version_file_path, 'wb') as versionJsonFile:
                                 versionJsonFile.write(version_data)
@@ -290,12 +289,12 @@ def main():
                         is_parsable = False
                         exception = None
                         try:
-                            ForgeInstallerProfile.parse_raw(install_profile_data)
+                            ForgeInstallerProfile.model_validate_json(install_profile_data)
                             is_parsable = True
                         except ValidationError as err:
                             exception = err
                         try:
-                            ForgeInstallerProfileV2.parse_raw(install_profile_data)
+                            ForgeInstallerProfileV2.model_validate_json(install_profile_data)
                             is_parsable = True
                         except ValidationError as err:
                             exception = err
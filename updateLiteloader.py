@@ -26,7 +26,7 @@ def main():
     main_json = r.json()
 
     # make sure we understand the schema
-    remote_versions = LiteloaderIndex.parse_obj(main_json)
+    remote_versions = LiteloaderIndex.model_validate(main_json)
     parsed = remote_versions.json()
     original = json.dumps(main_json, sort_keys=True, indent=4)
     assert parsed == original
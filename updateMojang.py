@@ -56,7 +56,7 @@ def main():
     r = sess.get('https://piston-meta.mojang.com/mc/game/version_manifest_v2.json')
     r.raise_for_status()
 
-    remote_versions = MojangIndexWrap(MojangIndex(**r.json()))
+    remote_versions = MojangIndexWrap(MojangIndex.model_validate_json(r.content))
     remote_ids = set(remote_versions.versions.keys())
 
     version_manifest_path = os.path.join(UPSTREAM_DIR, VERSION_MANIFEST_FILE)